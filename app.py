@@ -1,7 +1,15 @@
 import streamlit as st
+import numpy as np
+import hashlib
+import inspect
+import io
+import mmap
 import os
+import shutil
 import sys
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # THIS MUST BE THE FIRST STREAMLIT COMMAND - NO OTHER STREAMLIT COMMANDS BEFORE THIS
@@ -15,25 +23,36 @@ st.set_page_config(
 current_dir = Path(__file__).resolve().parent
 sys.path.insert(0, str(current_dir))
 
-# Import the BlogProcessor
-try:
-    from src.blog_processor import BlogProcessor
+# Import the BlogProcessor lazily; st.cache_resource keeps the result across reruns
+# (the script runs in a fresh namespace each time, so a plain lru_cache would not),
+# so the import and signature check happen once per server process
+@st.cache_resource(show_spinner=False)
+def load_blog_processor():
+    try:
+        from src.blog_processor import BlogProcessor
+    except ImportError as e:
+        return None, False, str(e)
+
+    # Older processors only accept a document path, not a stream
+    accepts_stream = "doc_stream" in inspect.signature(BlogProcessor.process_blog).parameters
+    return BlogProcessor, accepts_stream, None
 
-    blog_processor_available = True
-except ImportError as e:
-    blog_processor_available = False
-    import_error = str(e)
 
-try:
-    from src.screenshot_extractor import extract_screenshots_at_times
-    from src.video_clipper import extract_video_clip
+# Import the video utilities lazily so tools that don't need OpenCV/ffmpeg skip them;
+# cached across reruns like load_blog_processor
+@st.cache_resource(show_spinner=False)
+def load_video_utils():
+    try:
+        from src.screenshot_extractor import extract_screenshots_at_times
+        from src.videoclipper import extract_video_clip
+    except ImportError as e:
+        return None, None, str(e)
+
+    return extract_screenshots_at_times, extract_video_clip, None
 
-    video_utils_available = True
-except ImportError:
-    video_utils_available = False
 
-# NOW you can add styles
-st.markdown("""
+# Page styles, defined once at module level
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -76,44 +95,29 @@ st.markdown("""
         border-radius: 5px;
     }
 </style>
-""", unsafe_allow_html=True)
-
-# Display debug info in sidebar
-debug_expander = st.sidebar.expander("Debug Info")
-with debug_expander:
-    st.write("Current working directory:", os.getcwd())
-    st.write("Python path:")
-    for path in sys.path:
-        st.write(f"- {path}")
-
-    if blog_processor_available:
-        st.write("✅ BlogProcessor successfully imported")
-    else:
-        st.write(f"❌ BlogProcessor import error: {import_error}")
+"""
+
+# NOW you can add styles (st.html injects them without running the markdown parser)
+st.html(APP_CSS)
+
+# Cache directory listings for the debug panel so repeated expansions skip the filesystem
+@st.cache_data(ttl=60)
+def list_dir(path):
+    return os.listdir(path)
 
-    # List files in current directory to help with debugging
-    st.write("Files in current directory:")
-    try:
-        files = os.listdir(".")
-        for file in files:
-            st.write(f"- {file}")
-
-        if os.path.exists("src"):
-            st.write("Files in src directory:")
-            src_files = os.listdir("src")
-            for file in src_files:
-                st.write(f"- src/{file}")
-    except Exception as e:
-        st.write(f"Error listing files: {str(e)}")
-
-# Now check if video utilities are accessible
-# (This must be AFTER the page config, unlike in your previous code)
-try:
-    from src.videoclipper import extract_video_clip as vc_extract
-
-    st.sidebar.success("✅ Video utilities successfully imported")
-except ImportError as e:
-    st.sidebar.error(f"❌ Failed to import video utilities: {str(e)}")
+
+# Function to show an error message, adding the full traceback only in debug mode
+def report_exception(message, e, show=st.error):
+    show(message)
+    if debug_mode:
+        st.exception(e)
+
+
+# Debug mode is enabled by opening the page with ?debug=1
+debug_mode = st.query_params.get("debug") == "1"
+
+# Reserve the top of the sidebar for status info, filled in once the tool is chosen
+sidebar_status = st.sidebar.container()
 
 # Sidebar navigation
 st.sidebar.title("Navigation")
@@ -122,12 +126,291 @@ app_mode = st.sidebar.selectbox(
     ["Home", "Blog Processor", "Video Screenshot Tool", "Video Clipper"]
 )
 
+# Only import the modules the selected tool (or the debug panel) needs
+blog_processor_available = video_utils_available = False
+import_error = video_import_error = None
+if debug_mode or app_mode in ("Home", "Blog Processor"):
+    BlogProcessor, blog_processor_accepts_stream, import_error = load_blog_processor()
+    blog_processor_available = BlogProcessor is not None
+if debug_mode or app_mode in ("Home", "Video Screenshot Tool", "Video Clipper"):
+    extract_screenshots_at_times, extract_video_clip, video_import_error = load_video_utils()
+    video_utils_available = extract_video_clip is not None
+
+# Display debug info in sidebar (only when the page is opened with ?debug=1)
+with sidebar_status:
+    if debug_mode:
+        debug_expander = st.expander("Debug Info")
+        with debug_expander:
+            st.write("Current working directory:", os.getcwd())
+            st.write("Python path:")
+            for path in sys.path:
+                st.write(f"- {path}")
+
+            if blog_processor_available:
+                st.write("✅ BlogProcessor successfully imported")
+            else:
+                st.write(f"❌ BlogProcessor import error: {import_error}")
+
+            # List files in current directory to help with debugging
+            st.write("Files in current directory:")
+            try:
+                files = list_dir(".")
+                for file in files:
+                    st.write(f"- {file}")
+
+                if os.path.exists("src"):
+                    st.write("Files in src directory:")
+                    src_files = list_dir("src")
+                    for file in src_files:
+                        st.write(f"- src/{file}")
+            except Exception as e:
+                st.write(f"Error listing files: {str(e)}")
+
+    # Report whether the video utilities were imported (when this tool loaded them)
+    if video_utils_available:
+        st.success("✅ Video utilities successfully imported")
+    elif video_import_error:
+        st.error(f"❌ Failed to import video utilities: {video_import_error}")
+
+
+# Free space that must remain in a temp location after an upload is staged there
+TEMP_DIR_HEADROOM = 1024 ** 3
+
+
+# Function to pick where an upload of the given size is staged: RAM-backed /dev/shm
+# when it has room for it, otherwise the system temp directory
+def get_temp_base(size):
+    for candidate in ("/dev/shm", tempfile.gettempdir()):
+        try:
+            fs_stat = os.statvfs(candidate)
+        except (OSError, AttributeError):  # missing path, or no statvfs on Windows
+            continue
+        if fs_stat.f_bavail * fs_stat.f_frsize > size + TEMP_DIR_HEADROOM:
+            return candidate
+    return tempfile.gettempdir()
+
+
+# Function to create an output directory, skipping the mkdir if this session already made it
+def ensure_dir(folder):
+    if "dirs_made" not in st.session_state:
+        st.session_state["dirs_made"] = set()
+    if folder not in st.session_state["dirs_made"]:
+        os.makedirs(folder, exist_ok=True)
+        st.session_state["dirs_made"].add(folder)
+
+
+# Size of the copy buffer used when staging uploads on disk
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+# Function to stream an uploaded file to disk without loading it into memory
+def save_upload(uploaded_file, dest_path):
+    uploaded_file.seek(0)
+    with open(dest_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+        shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
+
+
+# Function to stage an upload on disk once; each slot (one per uploader) keeps a
+# single staged file, and the previous one is deleted when the upload changes.
+# Files go in a folder named after the file_id so sessions can't clobber each other.
+def stage_upload(uploaded_file, slot):
+    staged = st.session_state.setdefault("staged_uploads", {})
+    previous = staged.get(slot)
+    if previous is not None:
+        file_id, path = previous
+        if file_id == uploaded_file.file_id and path.exists():
+            return path
+        shutil.rmtree(path.parent, ignore_errors=True)
+
+    upload_dir = Path(get_temp_base(uploaded_file.size)) / "blog_creator_temp" / uploaded_file.file_id
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    path = upload_dir / uploaded_file.name
+    if uploaded_file.size <= UPLOAD_CHUNK_SIZE:
+        # Small files such as Word documents fit in one buffer, so a single write is cheaper than streaming
+        path.write_bytes(uploaded_file.getvalue())
+    else:
+        save_upload(uploaded_file, path)
+    staged[slot] = (uploaded_file.file_id, path)
+    return path
+
+
+# Share one processor per output directory across reruns and users; BlogProcessor keeps
+# no per-request state, so the same instance can be reused without a reset
+@st.cache_resource(max_entries=4)
+def get_processor(output_base_dir):
+    return BlogProcessor(output_base_dir=output_base_dir)
+
+
+# Function to compute a content hash of an open binary stream
+def stream_hash(stream):
+    stream.seek(0)
+    digest = hashlib.file_digest(stream, "blake2b").hexdigest()
+    stream.seek(0)
+    return digest
+
+
+# Function to hash an upload once; the digest is kept in session state under the
+# upload's file_id, so later clicks with the same upload don't reread it
+def upload_hash(uploaded_file):
+    hashes = st.session_state.setdefault("upload_hashes", {})
+    if uploaded_file.file_id not in hashes:
+        hashes[uploaded_file.file_id] = stream_hash(uploaded_file)
+    return hashes[uploaded_file.file_id]
+
+
+# Maximum number of screenshots extracted concurrently
+MAX_SCREENSHOT_WORKERS = 8
+
+
+# Function to extract a single screenshot; runs in a worker thread, so no st.* calls here
+def extract_one_screenshot(video_path, output_folder, index, timestamp):
+    extract_screenshots_at_times(video_path, output_folder, [timestamp], first_index=index)
+
+
+# Raised inside run_blog so a failed result is never stored by st.cache_data
+class BlogProcessingFailed(Exception):
+    def __init__(self, result):
+        super().__init__("Blog processing failed")
+        self.result = result
+
+
+# Memoize successful blog processing on the content hashes of the inputs; the
+# underscore-prefixed paths and stream are left out of Streamlit's cache key, since
+# staged paths include the upload's file_id and differ for every re-upload
+@st.cache_data(show_spinner=False)
+def run_blog(doc_hash, video_hash, output_base_dir, _doc_path, _video_path, _doc_stream=None):
+    processor = get_processor(output_base_dir)
+    if _doc_stream is not None:
+        _doc_stream.seek(0)
+        result = processor.process_blog(_doc_path, _video_path, doc_stream=_doc_stream)
+    else:
+        result = processor.process_blog(_doc_path, _video_path)
+    if not result.success:
+        raise BlogProcessingFailed(result)
+    return result
+
+
+# Largest slice of the generated HTML rendered in the preview
+HTML_PREVIEW_BYTES = 256 * 1024
+
+
+# Cache the generated HTML as raw bytes, keyed by path and modification time
+@st.cache_data
+def load_html(path, mtime):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap cannot map an empty file
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return bytes(mm)
+
+
+# Bundle files into a ZIP archive, keyed by (path, mtime) pairs;
+# images are already compressed, so entries are stored without recompression
+@st.cache_data(max_entries=8)
+def build_zip(entries):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        for path, _ in entries:
+            zf.write(path, arcname=os.path.basename(path))
+    return buf.getvalue()
+
+
+# Image extensions shown in the media gallery
+MEDIA_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif'})
+
+# Width of each gallery thumbnail; images wrap into rows like the old 3-column grid
+GALLERY_IMAGE_WIDTH = 320
+
+
+# Cache the media file listing, keyed by folder and modification time
+@st.cache_data
+def list_media(folder, mtime):
+    # Screenshots land in per-video subfolders, so descend with scandir;
+    # DirEntry type checks come from the directory listing without a stat call
+    media_files = []
+    pending = [folder]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTS:
+                    media_files.append(entry.path)
+    return sorted(media_files)
+
+
+# Display the processed blog; runs as a fragment so clicking a download
+# button only reruns this section instead of the whole script
+@st.fragment
+def show_blog_result(result):
+    if result.success:
+        st.markdown(f'<div class="success-message">Blog processed successfully!</div>',
+                    unsafe_allow_html=True)
+        st.markdown("### Generated Files:")
+        st.markdown(f"**HTML file:** {result.html_path}")
+        st.markdown(f"**Media folder:** {result.media_folder}")
+
+        if result.warnings:
+            st.warning("### Warnings:")
+            for warning in result.warnings:
+                st.write(f"- {warning}")
+
+        # FEATURE 1: Add download button for HTML
+        try:
+            html_content = load_html(result.html_path, os.path.getmtime(result.html_path))
+            st.download_button(
+                "Download HTML File",
+                html_content,
+                file_name=os.path.basename(result.html_path),
+                mime="text/html"
+            )
+        except Exception as e:
+            st.warning(f"Could not create HTML download: {str(e)}")
 
-# Function to create temp directory
-def get_temp_dir():
-    temp_dir = Path(tempfile.gettempdir()) / "blog_creator_temp"
-    temp_dir.mkdir(exist_ok=True)
-    return temp_dir
+        # FEATURE 2: Display HTML preview
+        html_preview_expander = st.expander("HTML Preview", expanded=False)
+        with html_preview_expander:
+            try:
+                st.markdown('<div class="preview-container">', unsafe_allow_html=True)
+                st.markdown(html_content[:HTML_PREVIEW_BYTES].decode("utf-8", errors="ignore"),
+                            unsafe_allow_html=True)
+                if len(html_content) > HTML_PREVIEW_BYTES:
+                    st.info("Preview truncated; download the HTML file to see the full post.")
+                st.markdown('</div>', unsafe_allow_html=True)
+            except Exception as e:
+                st.warning(f"Could not preview HTML: {str(e)}")
+
+        # FEATURE 3: Display generated media files
+        media_expander = st.expander("Media Files", expanded=True)
+        with media_expander:
+            try:
+                # Find all image files in the media folder
+                media_files = list_media(result.media_folder,
+                                         os.path.getmtime(result.media_folder))
+
+                if media_files:
+                    st.markdown(f"Found {len(media_files)} media files:")
+
+                    # Display all images in a single gallery call
+                    st.image(media_files, caption=[os.path.basename(p) for p in media_files],
+                             width=GALLERY_IMAGE_WIDTH)
+
+                    # Add one download button for all images
+                    st.download_button(
+                        "Download all media",
+                        build_zip(tuple((p, os.path.getmtime(p)) for p in media_files)),
+                        file_name="media.zip",
+                        mime="application/zip"
+                    )
+                else:
+                    st.info("No media files generated.")
+            except Exception as e:
+                report_exception(f"Could not display media files: {str(e)}", e, show=st.warning)
+    else:
+        st.error("Blog processing failed!")
+        if result.errors:
+            for error in result.errors:
+                st.error(f"Error: {error}")
 
 
 # Home page
@@ -181,16 +464,9 @@ elif app_mode == "Blog Processor" and blog_processor_available:
 
     # Check if both files are uploaded
     if uploaded_doc is not None and uploaded_video is not None:
-        # Create temporary files
-        temp_dir = get_temp_dir()
-        temp_doc = temp_dir / uploaded_doc.name
-        temp_video = temp_dir / uploaded_video.name
-
-        with open(temp_doc, "wb") as f:
-            f.write(uploaded_doc.getvalue())
-
-        with open(temp_video, "wb") as f:
-            f.write(uploaded_video.getvalue())
+        # Stage the uploads on disk (the document is read straight from the upload when supported)
+        temp_doc = None if blog_processor_accepts_stream else stage_upload(uploaded_doc, "blog_doc")
+        temp_video = stage_upload(uploaded_video, "blog_video")
 
         st.markdown(
             f'<div class="file-info">Document: {uploaded_doc.name} ({uploaded_doc.size / 1024:.1f} KB)<br>Video: {uploaded_video.name} ({uploaded_video.size / 1024 / 1024:.1f} MB)</div>',
@@ -198,100 +474,42 @@ elif app_mode == "Blog Processor" and blog_processor_available:
 
         output_folder = st.text_input("Output folder name", "processed_blogs")
 
+        # Identify the current inputs so a stored result is only shown for them
+        upload_key = (uploaded_doc.file_id, uploaded_video.file_id, output_folder)
+
+        # Drop a stored result once the uploads or output folder change
+        if st.session_state.get("blog_result_key") != upload_key:
+            st.session_state.pop("blog_result", None)
+            st.session_state.pop("blog_result_key", None)
+
         if st.button("Process Blog"):
             with st.spinner("Processing blog..."):
                 try:
                     # Create output directory
-                    os.makedirs(output_folder, exist_ok=True)
-
-                    # Initialize processor with the output directory
-                    processor = BlogProcessor(output_base_dir=output_folder)
-
-                    # Process the blog
-                    result = processor.process_blog(str(temp_doc), str(temp_video))
-
-                    # Show result
-                    if result.success:
-                        st.markdown(f'<div class="success-message">Blog processed successfully!</div>',
-                                    unsafe_allow_html=True)
-                        st.markdown("### Generated Files:")
-                        st.markdown(f"**HTML file:** {result.html_path}")
-                        st.markdown(f"**Media folder:** {result.media_folder}")
-
-                        if result.warnings:
-                            st.warning("### Warnings:")
-                            for warning in result.warnings:
-                                st.write(f"- {warning}")
-
-                        # FEATURE 1: Add download button for HTML
-                        try:
-                            with open(result.html_path, "r", encoding="utf-8") as f:
-                                html_content = f.read()
-                                st.download_button(
-                                    "Download HTML File",
-                                    html_content,
-                                    file_name=os.path.basename(result.html_path),
-                                    mime="text/html"
-                                )
-                        except Exception as e:
-                            st.warning(f"Could not create HTML download: {str(e)}")
-
-                        # FEATURE 2: Display HTML preview
-                        html_preview_expander = st.expander("HTML Preview", expanded=False)
-                        with html_preview_expander:
-                            try:
-                                st.markdown('<div class="preview-container">', unsafe_allow_html=True)
-                                st.markdown(html_content, unsafe_allow_html=True)
-                                st.markdown('</div>', unsafe_allow_html=True)
-                            except Exception as e:
-                                st.warning(f"Could not preview HTML: {str(e)}")
-
-                        # FEATURE 3: Display generated media files
-                        media_expander = st.expander("Media Files", expanded=True)
-                        with media_expander:
-                            try:
-                                # Find all image files in the media folder
-                                media_files = []
-                                for root, dirs, files in os.walk(result.media_folder):
-                                    for file in files:
-                                        if file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif')):
-                                            media_files.append(os.path.join(root, file))
-
-                                if media_files:
-                                    st.markdown(f"Found {len(media_files)} media files:")
-
-                                    # Create columns for images
-                                    col_count = 3  # Number of columns for image gallery
-                                    cols = st.columns(col_count)
-
-                                    # Display images in columns
-                                    for i, img_path in enumerate(media_files):
-                                        with cols[i % col_count]:
-                                            st.image(img_path, caption=os.path.basename(img_path),
-                                                     use_column_width=True)
-
-                                            # Add download button for each image
-                                            with open(img_path, "rb") as img_file:
-                                                st.download_button(
-                                                    f"Download {os.path.basename(img_path)}",
-                                                    img_file,
-                                                    file_name=os.path.basename(img_path),
-                                                    mime=f"image/{os.path.splitext(img_path)[1][1:]}"
-                                                )
-                                else:
-                                    st.info("No media files generated.")
-                            except Exception as e:
-                                st.warning(f"Could not display media files: {str(e)}")
-                                st.exception(e)
-                    else:
-                        st.error("Blog processing failed!")
-                        if result.errors:
-                            for error in result.errors:
-                                st.error(f"Error: {error}")
+                    ensure_dir(output_folder)
 
+                    # Process the blog (reuses the earlier result for identical inputs)
+                    blog_args = (upload_hash(uploaded_doc), upload_hash(uploaded_video), output_folder,
+                                 uploaded_doc.name if blog_processor_accepts_stream else str(temp_doc),
+                                 str(temp_video))
+                    doc_stream = uploaded_doc if blog_processor_accepts_stream else None
+                    try:
+                        result = run_blog(*blog_args, _doc_stream=doc_stream)
+                        # A cached result can outlive its files; regenerate them if they're gone
+                        if not os.path.exists(result.html_path):
+                            run_blog.clear()
+                            result = run_blog(*blog_args, _doc_stream=doc_stream)
+                    except BlogProcessingFailed as e:
+                        result = e.result
+
+                    # Keep the result so later reruns can show it without reprocessing
+                    st.session_state["blog_result"] = result
+                    st.session_state["blog_result_key"] = upload_key
                 except Exception as e:
-                    st.error(f"Error processing blog: {str(e)}")
-                    st.exception(e)  # This will display the full traceback
+                    report_exception(f"Error processing blog: {str(e)}", e)
+
+        if st.session_state.get("blog_result"):
+            show_blog_result(st.session_state["blog_result"])
 
 # Video Screenshot Tool
 elif app_mode == "Video Screenshot Tool" and video_utils_available:
@@ -301,12 +519,8 @@ elif app_mode == "Video Screenshot Tool" and video_utils_available:
     uploaded_video = st.file_uploader("Upload a video file", type=["mp4", "mov", "avi", "mkv"])
 
     if uploaded_video is not None:
-        # Create a temporary file
-        temp_dir = get_temp_dir()
-        temp_video = temp_dir / uploaded_video.name
-
-        with open(temp_video, "wb") as f:
-            f.write(uploaded_video.getvalue())
+        # Stage the upload on disk (copied only when the upload changes)
+        temp_video = stage_upload(uploaded_video, "screenshot_video")
 
         st.markdown(
             f'<div class="file-info">Video uploaded: {uploaded_video.name} ({uploaded_video.size / 1024 / 1024:.1f} MB)</div>',
@@ -327,11 +541,15 @@ elif app_mode == "Video Screenshot Tool" and video_utils_available:
         with col2:
             st.write("Preview of timestamps:")
             try:
-                timestamps = [float(t.strip()) for t in timestamps_input.strip().split("\n") if t.strip()]
-                for i, ts in enumerate(timestamps):
-                    mins, secs = divmod(ts, 60)
-                    st.text(f"Screenshot {i + 1}: {int(mins)}m {secs:.1f}s")
+                # Convert all values in one pass; raises ValueError on any non-numeric entry
+                timestamp_array = np.array(timestamps_input.split(), dtype=float)
+                timestamps = timestamp_array.tolist()
+                mins, secs = np.divmod(timestamp_array, 60.0)
+                lines = [f"Screenshot {i + 1}: {int(m)}m {sec:.1f}s" for i, (m, sec) in enumerate(zip(mins, secs))]
+                if lines:
+                    st.text("\n".join(lines))
             except ValueError:
+                timestamps = []
                 st.error("Please enter valid numbers for timestamps")
 
         output_folder = st.text_input("Output folder name", "screenshots")
@@ -341,10 +559,12 @@ elif app_mode == "Video Screenshot Tool" and video_utils_available:
                 with st.spinner("Extracting screenshots..."):
                     try:
                         # Create output directory
-                        os.makedirs(output_folder, exist_ok=True)
+                        ensure_dir(output_folder)
 
-                        # Extract screenshots
-                        extract_screenshots_at_times(str(temp_video), output_folder, timestamps)
+                        # Extract screenshots in parallel; OpenCV releases the GIL while seeking and decoding
+                        with ThreadPoolExecutor(max_workers=min(MAX_SCREENSHOT_WORKERS, len(timestamps))) as ex:
+                            list(ex.map(extract_one_screenshot, [str(temp_video)] * len(timestamps),
+                                        [output_folder] * len(timestamps), range(len(timestamps)), timestamps))
 
                         # Show success message
                         st.markdown(
@@ -358,30 +578,23 @@ elif app_mode == "Video Screenshot Tool" and video_utils_available:
                                                 if f.endswith(('.jpg', '.png'))]
 
                             if screenshot_files:
-                                # Create columns for the gallery
-                                col_count = 3  # Number of columns
-                                cols = st.columns(col_count)
-
-                                for i, img_path in enumerate(screenshot_files):
-                                    with cols[i % col_count]:
-                                        st.image(img_path, caption=os.path.basename(img_path), use_column_width=True)
-
-                                        # Add download button for each image
-                                        with open(img_path, "rb") as img_file:
-                                            st.download_button(
-                                                f"Download",
-                                                img_file,
-                                                file_name=os.path.basename(img_path),
-                                                mime=f"image/{os.path.splitext(img_path)[1][1:]}"
-                                            )
+                                # Display all screenshots in a single gallery call
+                                st.image(screenshot_files, caption=[os.path.basename(p) for p in screenshot_files],
+                                         width=GALLERY_IMAGE_WIDTH)
+
+                                # Add one download button for all screenshots
+                                st.download_button(
+                                    "Download all screenshots",
+                                    build_zip(tuple((p, os.path.getmtime(p)) for p in screenshot_files)),
+                                    file_name="screenshots.zip",
+                                    mime="application/zip"
+                                )
                             else:
                                 st.warning("No screenshots were generated.")
                         except Exception as e:
-                            st.warning(f"Could not display screenshots: {str(e)}")
-                            st.exception(e)
+                            report_exception(f"Could not display screenshots: {str(e)}", e, show=st.warning)
                     except Exception as e:
-                        st.error(f"Error extracting screenshots: {str(e)}")
-                        st.exception(e)
+                        report_exception(f"Error extracting screenshots: {str(e)}", e)
             else:
                 st.error("Please enter at least one valid timestamp")
 
@@ -393,12 +606,8 @@ elif app_mode == "Video Clipper" and video_utils_available:
     uploaded_video = st.file_uploader("Upload a video file", type=["mp4", "mov", "avi", "mkv"])
 
     if uploaded_video is not None:
-        # Create a temporary file
-        temp_dir = get_temp_dir()
-        temp_video = temp_dir / uploaded_video.name
-
-        with open(temp_video, "wb") as f:
-            f.write(uploaded_video.getvalue())
+        # Stage the upload on disk (copied only when the upload changes)
+        temp_video = stage_upload(uploaded_video, "clip_video")
 
         st.markdown(
             f'<div class="file-info">Video uploaded: {uploaded_video.name} ({uploaded_video.size / 1024 / 1024:.1f} MB)</div>',
@@ -429,7 +638,7 @@ elif app_mode == "Video Clipper" and video_utils_available:
             with st.spinner("Extracting video clip..."):
                 try:
                     # Create output directory
-                    os.makedirs(output_folder, exist_ok=True)
+                    ensure_dir(output_folder)
 
                     # Extract clip
                     output_path = extract_video_clip(str(temp_video), output_folder, start_time, duration)
@@ -439,26 +648,32 @@ elif app_mode == "Video Clipper" and video_utils_available:
                                 unsafe_allow_html=True)
                     st.markdown(f"Saved to: **{output_path}**")
 
-                    # Play the video
-                    try:
-                        with open(output_path, 'rb') as video_file:
-                            video_bytes = video_file.read()
-                            st.video(video_bytes)
-
-                            # Add download button for the video
-                            st.download_button(
-                                "Download Video Clip",
-                                video_bytes,
-                                file_name=os.path.basename(output_path),
-                                mime="video/mp4"
-                            )
-                    except Exception as e:
-                        st.warning(f"Could not display or download video: {str(e)}")
-                        st.exception(e)
-
+                    # Keep the clip so it stays playable across reruns of this upload
+                    st.session_state["last_clip"] = (uploaded_video.file_id, output_path)
                 except Exception as e:
-                    st.error(f"Error extracting clip: {str(e)}")
-                    st.exception(e)
+                    report_exception(f"Error extracting clip: {str(e)}", e)
+
+        # Drop a stored clip once a different video is uploaded
+        clip_upload_id, last_clip = st.session_state.get("last_clip", (None, None))
+        if clip_upload_id != uploaded_video.file_id:
+            st.session_state.pop("last_clip", None)
+            last_clip = None
+
+        # Play the video from its path so Streamlit streams it instead of embedding the bytes
+        if last_clip and os.path.exists(last_clip):
+            try:
+                st.video(last_clip)
+
+                # Only read the clip into memory when a download is requested
+                if st.button("Prepare download"):
+                    st.download_button(
+                        "Download Video Clip",
+                        Path(last_clip).read_bytes(),
+                        file_name=os.path.basename(last_clip),
+                        mime="video/mp4"
+                    )
+            except Exception as e:
+                report_exception(f"Could not display or download video: {str(e)}", e, show=st.warning)
 
 # Module not available warnings
 elif app_mode == "Blog Processor" and not blog_processor_available:
@@ -470,14 +685,14 @@ elif app_mode == "Blog Processor" and not blog_processor_available:
     3. Check that all required dependencies are installed
     """)
 
-    if 'import_error' in locals():
+    if import_error:
         st.code(f"Import error: {import_error}")
 
 elif (app_mode == "Video Screenshot Tool" or app_mode == "Video Clipper") and not video_utils_available:
     st.error("Video utilities are not available. Please check your installation.")
     st.info("""
     To fix this issue:
-    1. Make sure your project structure includes src/screenshot_extractor.py and src/video_clipper.py files
+    1. Make sure your project structure includes src/screenshot_extractor.py and src/videoclipper.py files
     2. Make sure all required dependencies (like opencv-python and ffmpeg-python) are installed
     """)
 
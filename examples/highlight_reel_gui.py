@@ -1,6 +1,8 @@
 import sys
 import os
 import re
+import queue
+import subprocess
 from pathlib import Path
 
 # Add project root to path
@@ -10,15 +12,121 @@ sys.path.insert(0, str(project_root))
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QLabel,
                              QVBoxLayout, QHBoxLayout, QWidget, QFileDialog,
-                             QTextEdit, QProgressBar, QFrame, QScrollArea,
+                             QTextEdit, QPlainTextEdit, QProgressBar, QFrame, QScrollArea,
                              QComboBox, QCheckBox, QMessageBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QSize,
+                          QRegularExpression)
 from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
 
 # Import the base highlight reel extractor (no title cards)
 from src.highlight_reel_extractor import VideoSegment, extract_segments_from_text
 from src.highlight_reel_extractor import create_highlight_reel
 
+# Application-wide stylesheet, parsed once in main() instead of per widget
+GLOBAL_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QLabel {
+        color: #333333;
+    }
+    QComboBox {
+        min-height: 30px;
+        padding: 5px;
+        border: 1px solid #aaaaaa;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QComboBox::drop-down {
+        border: 0px;
+        width: 25px;
+    }
+    QPushButton[primary="true"] {
+        background-color: #4a86e8;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton[primary="true"]:hover {
+        background-color: #3a76d8;
+    }
+    QPushButton[primary="true"]:pressed {
+        background-color: #2a66c8;
+    }
+    QPushButton[primary="true"]:disabled {
+        background-color: #cccccc;
+        color: #888888;
+    }
+    QPushButton[primary="false"] {
+        background-color: #e0e0e0;
+        color: #333333;
+        border: 1px solid #aaaaaa;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton[primary="false"]:hover {
+        background-color: #d0d0d0;
+        border: 1px solid #888888;
+    }
+    QPushButton[primary="false"]:pressed {
+        background-color: #c0c0c0;
+    }
+    QFrame#FileSelectionCard, QFrame#FormatCard {
+        background-color: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 6px;
+    }
+    QLabel#FileLabel {
+        color: #777777;
+    }
+    QLabel#FileLabel[selected="true"] {
+        color: #333333;
+        font-weight: bold;
+    }
+    QLabel#DescriptionLabel {
+        color: #666666;
+    }
+    QLabel#FormatHelpLabel {
+        color: #666666;
+        padding: 5px;
+    }
+    QLabel#FormatDetails {
+        color: #333333;
+        padding: 5px;
+    }
+    QFrame#Separator {
+        background-color: #e0e0e0;
+    }
+    QTextEdit#ContentEditor {
+        background-color: white;
+        border: 1px solid #aaaaaa;
+        border-radius: 6px;
+        padding: 8px;
+    }
+    QProgressBar {
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background-color: #f0f0f0;
+        text-align: center;
+        height: 22px;
+    }
+    QProgressBar::chunk {
+        background-color: #4a86e8;
+        border-radius: 3px;
+    }
+    QPlainTextEdit#LogOutput {
+        background-color: white;
+        border: 1px solid #aaaaaa;
+        border-radius: 6px;
+        padding: 8px;
+        font-family: monospace;
+    }
+"""
+
+
 class StyledButton(QPushButton):
     """Custom styled button with modern appearance"""
 
@@ -30,45 +138,8 @@ class StyledButton(QPushButton):
         font.setBold(True)  # Make text bold
         self.setFont(font)
 
-        if primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4a86e8;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #3a76d8;
-                }
-                QPushButton:pressed {
-                    background-color: #2a66c8;
-                }
-                QPushButton:disabled {
-                    background-color: #cccccc;
-                    color: #888888;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333333;
-                    border: 1px solid #aaaaaa;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #d0d0d0;
-                    border: 1px solid #888888;
-                }
-                QPushButton:pressed {
-                    background-color: #c0c0c0;
-                }
-            """)
+        # Appearance comes from the application stylesheet
+        self.setProperty("primary", "true" if primary else "false")
 
         if icon:
             self.setIcon(QIcon(icon))
@@ -81,13 +152,7 @@ class FileSelectionCard(QFrame):
     def __init__(self, title, icon_path=None, select_text="Select File"):
         super().__init__()
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-            }
-        """)
+        self.setObjectName("FileSelectionCard")
 
         layout = QVBoxLayout(self)
 
@@ -108,7 +173,7 @@ class FileSelectionCard(QFrame):
         status_layout.addWidget(self.status_icon)
 
         self.file_label = QLabel("No file selected")
-        self.file_label.setStyleSheet("color: #777777;")
+        self.file_label.setObjectName("FileLabel")
         status_layout.addWidget(self.file_label, 1)
 
         self.select_button = StyledButton(select_text)
@@ -120,46 +185,50 @@ class FileSelectionCard(QFrame):
     def set_file(self, file_path):
         if file_path:
             self.file_label.setText(os.path.basename(file_path))
-            self.file_label.setStyleSheet("color: #333333; font-weight: bold;")
-            self.status_icon = QLabel("✅")  # Change to checkmark
+            self.status_icon.setText("✅")  # Change to checkmark
         else:
             self.file_label.setText("No file selected")
-            self.file_label.setStyleSheet("color: #777777;")
+            self.status_icon.setText("📄")
+        self.file_label.setProperty("selected", "true" if file_path else "false")
+        self.file_label.style().polish(self.file_label)
 
 
-class WorkerThread(QThread):
-    """Worker thread for creating highlight reels without freezing the UI."""
-    update_progress = pyqtSignal(str)
+class WorkerSignals(QObject):
+    """Signals emitted by WorkerTask (a QRunnable can't define signals itself)."""
     finished = pyqtSignal(bool, str)
 
+
+class WorkerTask(QRunnable):
+    """Task for creating highlight reels on the global thread pool without freezing the UI.
+
+    Progress messages go into msg_queue, which the UI drains on a timer.
+    """
+
     def __init__(self, video_path, content, output_dir):
         super().__init__()
+        self.signals = WorkerSignals()
         self.video_path = video_path
         self.content = content
         self.output_dir = output_dir
+        self.msg_queue = queue.SimpleQueue()
 
     def run(self):
         try:
             # Extract segments from content
-            self.update_progress.emit("Analyzing content for video segments...")
+            self.msg_queue.put("Analyzing content for video segments...")
 
             # Use the extract_segments_from_text function
             segments = extract_segments_from_text(self.content)
 
             if not segments:
-                self.update_progress.emit("No valid segments found in the content.")
-                self.finished.emit(False, "No valid segments found.")
+                self.msg_queue.put("No valid segments found in the content.")
+                self.signals.finished.emit(False, "No valid segments found.")
                 return
 
-            self.update_progress.emit(f"Found {len(segments)} segments to extract.")
-
-            # Log segment details
-            for i, segment in enumerate(segments):
-                self.update_progress.emit(
-                    f"Segment {i + 1}: {segment.title} - "
-                    f"Start: {segment.start_time // 3600:02d}:{(segment.start_time % 3600) // 60:02d}:{segment.start_time % 60:02d}, "
-                    f"Duration: {segment.duration // 60:02d}:{segment.duration % 60:02d}"
-                )
+            # Log segment details in a single message (one signal and one log append)
+            lines = [f"Segment {i + 1}: {s.title} - Start: {s.start_hms}, Duration: {s.duration_ms}"
+                     for i, s in enumerate(segments)]
+            self.msg_queue.put(f"Found {len(segments)} segments to extract.\n" + "\n".join(lines))
 
             # Create output filename
             video_filename = os.path.splitext(os.path.basename(self.video_path))[0]
@@ -167,46 +236,87 @@ class WorkerThread(QThread):
             output_path = os.path.join(self.output_dir, output_filename)
 
             # Create highlight reel (directly using the base function without title cards)
-            self.update_progress.emit("Creating highlight reel (this may take a while)...")
-            output = create_highlight_reel(self.video_path, segments, output_path)
+            self.msg_queue.put("Creating highlight reel (this may take a while)...")
+            output = create_highlight_reel(self.video_path, segments, output_path,
+                                           on_progress=self.msg_queue.put)
 
-            self.update_progress.emit(f"Highlight reel created successfully!")
-            self.finished.emit(True, output)
+            self.msg_queue.put(f"Highlight reel created successfully!")
+            self.signals.finished.emit(True, output)
 
         except Exception as e:
-            self.update_progress.emit(f"Error: {str(e)}")
-            self.finished.emit(False, str(e))
+            self.msg_queue.put(f"Error: {str(e)}")
+            self.signals.finished.emit(False, str(e))
 
 
 class HighlightReelUI(QMainWindow):
     """UI for creating highlight reels from content specifications without title cards."""
 
+    # Text of the "Show Examples" dialog; constant, so built once with the class
+    _CUSTOM_FORMAT_EXAMPLE = """Video Highlight Reel Outline
+Segment 1: Opening Hook - AI Hallucinations in Action (01:30)
+**STARTING TIMESTAMP:** 00:16:30 **CONTENT DESCRIPTION:** Start with the most surprising discovery from our week: AI confidently making up contractor reviews that don't exist.
+
+Segment 2: Daily News Update Automation (01:45)
+**STARTING TIMESTAMP:** 00:02:30 **CONTENT DESCRIPTION:** Follow Netta's journey debugging the automated news email system.
+"""
+
+    _STANDARD_FORMAT_EXAMPLE = """#### Introduction (2 minutes)
+STARTING TIMESTAMP: 00:01:30
+- This is the introduction section
+- It contains bullet points for content
+
+#### Main Content (3 minutes)
+STARTING TIMESTAMP: 00:15:45
+- Here's the main content
+- With multiple points to cover
+"""
+
+    _SIMPLE_FORMAT_EXAMPLE = """SEGMENT: Opening Segment
+TIME: 00:01:30
+DURATION: 2 minutes
+This is the opening segment description.
+
+SEGMENT: Main Segment
+TIME: 00:15:45
+DURATION: 3 minutes
+This is the main segment description.
+"""
+
+    _FORMAT_EXAMPLES = (f"1. Custom Format (recommended):\n\n{_CUSTOM_FORMAT_EXAMPLE}\n\n"
+                        f"2. Standard Format:\n\n{_STANDARD_FORMAT_EXAMPLE}\n\n"
+                        f"3. Simple Format:\n\n{_SIMPLE_FORMAT_EXAMPLE}")
+
+    # Matches any non-whitespace character in the content editor
+    _NON_BLANK_RE = QRegularExpression(r"\S")
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Highlight Reel Creator (No Title Cards)")
         self.setMinimumWidth(700)
         self.setMinimumHeight(600)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QComboBox {
-                min-height: 30px;
-                padding: 5px;
-                border: 1px solid #aaaaaa;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QComboBox::drop-down {
-                border: 0px;
-                width: 25px;
-            }
-        """)
         self.video_path = None
-        self.is_processing = False
+        self.worker = None
+
+        # Polls the worker's message queue at ~60 Hz while processing
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(16)
+        self._drain_timer.timeout.connect(self._drain_log)
+
+        # Re-checks the process button once typing pauses, not on every keystroke
+        self._ready_timer = QTimer(self)
+        self._ready_timer.setSingleShot(True)
+        self._ready_timer.setInterval(200)
+        self._ready_timer.timeout.connect(self._check_ready_impl)
+
+        # Fonts shared by the header and section labels, built once
+        self._title_font = QFont(self.font())
+        self._title_font.setPointSize(16)
+        self._title_font.setBold(True)
+        self._section_font = QFont(self.font())
+        self._section_font.setPointSize(12)
+        self._section_font.setBold(True)
+        self._bold_font = QFont(self.font())
+        self._bold_font.setBold(True)
 
         # Create central widget and layout
         central_widget = QWidget()
@@ -217,31 +327,23 @@ class HighlightReelUI(QMainWindow):
 
         # Create header
         header = QLabel("Highlight Reel Creator")
-        header_font = header.font()
-        header_font.setPointSize(16)
-        header_font.setBold(True)
-        header.setFont(header_font)
+        header.setFont(self._title_font)
         main_layout.addWidget(header)
 
         # Description
         description = QLabel("Extract key moments from videos and create highlight reels (without title cards)")
-        description.setStyleSheet("color: #666666;")
+        description.setObjectName("DescriptionLabel")
         main_layout.addWidget(description)
 
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("background-color: #e0e0e0;")
+        separator.setObjectName("Separator")
         main_layout.addWidget(separator)
 
         # Create file selection area - Make section header more visible
-        section_label = QLabel("1. Select your video")
-        section_font = section_label.font()
-        section_font.setBold(True)
-        section_font.setPointSize(12)
-        section_label.setFont(section_font)
-        main_layout.addWidget(section_label)
+        main_layout.addWidget(self._make_section_label("1. Select your video"))
 
         # Video selection card
         self.video_card = FileSelectionCard("Video File", select_text="Select Video")
@@ -249,26 +351,16 @@ class HighlightReelUI(QMainWindow):
         main_layout.addWidget(self.video_card)
 
         # Format selection - Make section header more visible
-        section_label = QLabel("2. Enter segment details")
-        section_label.setFont(section_font)
-        main_layout.addWidget(section_label)
+        main_layout.addWidget(self._make_section_label("2. Enter segment details"))
 
         format_card = QFrame()
         format_card.setFrameShape(QFrame.Shape.StyledPanel)
-        format_card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-            }
-        """)
+        format_card.setObjectName("FormatCard")
         format_layout = QVBoxLayout(format_card)
 
         # Format help header
         format_header = QLabel("Format Information")
-        format_header_font = format_header.font()
-        format_header_font.setBold(True)
-        format_header.setFont(format_header_font)
+        format_header.setFont(self._bold_font)
         format_layout.addWidget(format_header)
 
         # Format selector layout with example button
@@ -278,7 +370,7 @@ class HighlightReelUI(QMainWindow):
             "Enter your highlight reel specification using one of the supported formats:"
         )
         self.format_help_label.setWordWrap(True)
-        self.format_help_label.setStyleSheet("color: #666666; padding: 5px;")
+        self.format_help_label.setObjectName("FormatHelpLabel")
         format_layout.addWidget(self.format_help_label)
 
         # Add format details
@@ -287,7 +379,7 @@ class HighlightReelUI(QMainWindow):
             "• Simple Format with SEGMENT:, TIME:, and DURATION: markers\n"
             "• Custom Format with 'Segment X:' titles and **STARTING TIMESTAMP:** markers"
         )
-        self.format_details.setStyleSheet("color: #333333; padding: 5px;")
+        self.format_details.setObjectName("FormatDetails")
         format_layout.addWidget(self.format_details)
 
         self.show_example_button = StyledButton("Show Examples")
@@ -301,22 +393,13 @@ class HighlightReelUI(QMainWindow):
 
         # Content editor
         content_label = QLabel("Segment Specifications:")
-        content_label_font = content_label.font()
-        content_label_font.setBold(True)
-        content_label.setFont(content_label_font)
+        content_label.setFont(self._bold_font)
         main_layout.addWidget(content_label)
 
         self.content_editor = QTextEdit()
         self.content_editor.setMinimumHeight(180)
-        self.content_editor.setStyleSheet("""
-            QTextEdit {
-                background-color: white;
-                border: 1px solid #aaaaaa;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
-        self.content_editor.textChanged.connect(self._check_ready)
+        self.content_editor.setObjectName("ContentEditor")
+        self.content_editor.textChanged.connect(self._ready_timer.start)
         main_layout.addWidget(self.content_editor)
 
         # Set placeholder text for the content editor
@@ -328,9 +411,7 @@ class HighlightReelUI(QMainWindow):
         )
 
         # Add output directory section - Make section header more visible
-        section_label = QLabel("3. Select output location")
-        section_label.setFont(section_font)
-        main_layout.addWidget(section_label)
+        main_layout.addWidget(self._make_section_label("3. Select output location"))
 
         # Output directory card
         self.output_card = FileSelectionCard("Output Directory", select_text="Select Folder")
@@ -348,25 +429,10 @@ class HighlightReelUI(QMainWindow):
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-                text-align: center;
-                height: 22px;
-            }
-            QProgressBar::chunk {
-                background-color: #4a86e8;
-                border-radius: 3px;
-            }
-        """)
         main_layout.addWidget(self.progress_bar)
 
         # Create log output area with scroll - Make section header more visible
-        section_label = QLabel("4. Results")
-        section_label.setFont(section_font)
-        main_layout.addWidget(section_label)
+        main_layout.addWidget(self._make_section_label("4. Results"))
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -376,27 +442,27 @@ class HighlightReelUI(QMainWindow):
         log_layout = QVBoxLayout(log_container)
         log_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.log_output = QTextEdit()
+        # Plain-text log with a bounded history keeps each append cheap
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(2000)
         self.log_output.setMinimumHeight(120)
-        self.log_output.setStyleSheet("""
-            QTextEdit {
-                background-color: white;
-                border: 1px solid #aaaaaa;
-                border-radius: 6px;
-                padding: 8px;
-                font-family: monospace;
-            }
-        """)
+        self.log_output.setObjectName("LogOutput")
         log_layout.addWidget(self.log_output)
 
         scroll.setWidget(log_container)
         main_layout.addWidget(scroll)
 
         # Show initial instructions
-        self.log_output.append("Welcome to the Highlight Reel Creator (No Title Cards)!")
-        self.log_output.append("This version creates highlight reels without title cards to preserve audio quality.")
-        self.log_output.append("Select your video file and enter segment specifications to begin.")
+        self.log_output.appendPlainText("Welcome to the Highlight Reel Creator (No Title Cards)!")
+        self.log_output.appendPlainText("This version creates highlight reels without title cards to preserve audio quality.")
+        self.log_output.appendPlainText("Select your video file and enter segment specifications to begin.")
+
+    def _make_section_label(self, text):
+        """Create a numbered section header label using the shared section font."""
+        label = QLabel(text)
+        label.setFont(self._section_font)
+        return label
 
     def _show_format_examples(self):
         """Show examples of the supported formats."""
@@ -404,41 +470,7 @@ class HighlightReelUI(QMainWindow):
         example_dialog.setWindowTitle("Format Examples")
         example_dialog.setText("Supported Format Examples")
 
-        custom_format = """Video Highlight Reel Outline
-Segment 1: Opening Hook - AI Hallucinations in Action (01:30)
-**STARTING TIMESTAMP:** 00:16:30 **CONTENT DESCRIPTION:** Start with the most surprising discovery from our week: AI confidently making up contractor reviews that don't exist.
-
-Segment 2: Daily News Update Automation (01:45)
-**STARTING TIMESTAMP:** 00:02:30 **CONTENT DESCRIPTION:** Follow Netta's journey debugging the automated news email system.
-"""
-
-        standard_format = """#### Introduction (2 minutes)
-STARTING TIMESTAMP: 00:01:30
-- This is the introduction section
-- It contains bullet points for content
-
-#### Main Content (3 minutes)
-STARTING TIMESTAMP: 00:15:45
-- Here's the main content
-- With multiple points to cover
-"""
-
-        simple_format = """SEGMENT: Opening Segment
-TIME: 00:01:30
-DURATION: 2 minutes
-This is the opening segment description.
-
-SEGMENT: Main Segment
-TIME: 00:15:45
-DURATION: 3 minutes
-This is the main segment description.
-"""
-
-        example_text = f"1. Custom Format (recommended):\n\n{custom_format}\n\n"
-        example_text += f"2. Standard Format:\n\n{standard_format}\n\n"
-        example_text += f"3. Simple Format:\n\n{simple_format}"
-
-        example_dialog.setDetailedText(example_text)
+        example_dialog.setDetailedText(self._FORMAT_EXAMPLES)
         example_dialog.exec()
 
     def _select_video(self):
@@ -453,8 +485,8 @@ This is the main segment description.
         if file_path:
             self.video_path = file_path
             self.video_card.set_file(file_path)
-            self._check_ready()
-            self.log_output.append(f"Selected video: {os.path.basename(file_path)}")
+            self._check_ready_impl()
+            self.log_output.appendPlainText(f"Selected video: {os.path.basename(file_path)}")
 
     def _select_output_dir(self):
         """Handle output directory selection."""
@@ -466,27 +498,30 @@ This is the main segment description.
 
         if dir_path:
             self.output_card.file_label.setText(dir_path)
-            self.log_output.append(f"Output directory: {dir_path}")
+            self.log_output.appendPlainText(f"Output directory: {dir_path}")
 
-    def _check_ready(self):
+    def _check_ready_impl(self):
         """Check if all conditions are met to enable the process button."""
         has_video = self.video_path is not None
-        has_content = len(self.content_editor.toPlainText().strip()) > 0
-        self.process_button.setEnabled(bool(has_video and has_content) and not self.is_processing)
+        # Query the document directly instead of serializing it with toPlainText()
+        document = self.content_editor.document()
+        has_content = (document.characterCount() > 1
+                       and not document.find(self._NON_BLANK_RE).isNull())
+        # The worker is cleared in process_finished, once its task is done
+        is_running = self.worker is not None
+        self.process_button.setEnabled(bool(has_video and has_content) and not is_running)
 
     def _process_highlight_reel(self):
         """Process the highlight reel with selected files and content."""
-        # Prevent multiple processing attempts
-        if self.is_processing:
+        # The button is disabled while a job runs, so a queued second click is ignored
+        if not self.process_button.isEnabled():
             return
 
-        self.is_processing = True
-
         try:
             self.progress_bar.setVisible(True)
             self.progress_bar.setRange(0, 0)  # Indeterminate progress
             self.process_button.setEnabled(False)
-            self.log_output.append("\nProcessing highlight reel...")
+            self.log_output.appendPlainText("\nProcessing highlight reel...")
 
             # Change cursor to waiting
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
@@ -494,71 +529,86 @@ This is the main segment description.
             content = self.content_editor.toPlainText()
             output_dir = self.output_card.file_label.text()
 
-            # Use a timer to allow the UI to update before starting processing
-            QTimer.singleShot(100, lambda: self._execute_processing(content, output_dir))
+            # Start the (non-blocking) worker task; the event loop repaints the UI once
+            # this handler returns. No processEvents() flush here: a debounced
+            # _check_ready_impl run during it would see no worker and re-enable the button.
+            self._execute_processing(content, output_dir)
 
         except Exception as e:
             self._reset_ui()
-            self.log_output.append(f"\n❌ Error setting up processing: {str(e)}")
+            self.log_output.appendPlainText(f"\n❌ Error setting up processing: {str(e)}")
 
     def _execute_processing(self, content, output_dir):
-        """Execute the actual highlight reel processing (called by timer)"""
+        """Execute the actual highlight reel processing"""
         try:
-            # Start worker thread
-            self.worker = WorkerThread(self.video_path, content, output_dir)
-            self.worker.update_progress.connect(self.update_progress)
-            self.worker.finished.connect(self.process_finished)
-            self.worker.start()
+            # Run the worker on the global pool, which reuses its threads across runs
+            self.worker = WorkerTask(self.video_path, content, output_dir)
+            self.worker.signals.finished.connect(self.process_finished)
+            QThreadPool.globalInstance().start(self.worker)
+            self._drain_timer.start()
         except Exception as e:
-            self.log_output.append(f"\n❌ Error: {str(e)}")
+            self.log_output.appendPlainText(f"\n❌ Error: {str(e)}")
+            # Clear the worker too, or _check_ready_impl keeps the button disabled
+            self._drain_timer.stop()
+            self.worker = None
             self._reset_ui()
 
-    def update_progress(self, message):
-        """Update progress message."""
-        self.log_output.append(message)
-
-        # Scroll to bottom of log
-        scroll_bar = self.log_output.verticalScrollBar()
-        scroll_bar.setValue(scroll_bar.maximum())
+    def _drain_log(self):
+        """Append all progress messages queued by the worker in a single log update."""
+        batch = []
+        while True:
+            try:
+                batch.append(self.worker.msg_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.log_output.appendPlainText("\n".join(batch))
 
     def process_finished(self, success, result):
-        """Handle completion of the worker thread."""
+        """Handle completion of the worker task."""
+        # Flush messages queued before the worker finished
+        self._drain_timer.stop()
+        self._drain_log()
+
         if success:
-            self.log_output.append("\n✅ Highlight reel created successfully!")
-            self.log_output.append(f"Output saved to: {result}")
+            self.log_output.appendPlainText("\n✅ Highlight reel created successfully!")
+            self.log_output.appendPlainText(f"Output saved to: {result}")
+            out_dir = os.path.dirname(result)
 
             # Try to open output folder
             try:
                 if sys.platform == "darwin":  # macOS
-                    os.system(f'open "{os.path.dirname(result)}"')
+                    subprocess.Popen(["open", out_dir])
                 elif sys.platform == "win32":  # Windows
-                    os.startfile(os.path.dirname(result))
-                self.log_output.append("\nOpened output folder!")
-            except Exception:
-                self.log_output.append(f"\nOutput folder is at: {os.path.dirname(result)}")
+                    os.startfile(out_dir)
+                else:  # Linux and other desktops
+                    subprocess.Popen(["xdg-open", out_dir])
+                self.log_output.appendPlainText("\nOpened output folder!")
+            except OSError:
+                self.log_output.appendPlainText(f"\nOutput folder is at: {out_dir}")
         else:
-            self.log_output.append("\n❌ Highlight reel creation failed!")
-            self.log_output.append(f"Error: {result}")
+            self.log_output.appendPlainText("\n❌ Highlight reel creation failed!")
+            self.log_output.appendPlainText(f"Error: {result}")
 
-        # Reset UI using a small delay to ensure everything completes
-        QTimer.singleShot(100, self._reset_ui)
+        # finished is the task's last action, so the button can be re-enabled now
+        self.worker = None
+        self._reset_ui()
 
     def _reset_ui(self):
         """Reset the UI after processing completes"""
-        self.is_processing = False
+        # No processEvents() here: this runs from normal signal delivery, so Qt
+        # repaints once control returns to the event loop
         self.progress_bar.setVisible(False)
-        self._check_ready()
+        self._check_ready_impl()
         QApplication.restoreOverrideCursor()
 
-        # Ensure we process any pending events
-        QApplication.processEvents()
-
 
 def main():
     app = QApplication(sys.argv)
 
     # Apply global stylesheet
     app.setStyle("Fusion")
+    app.setStyleSheet(GLOBAL_QSS)
 
     window = HighlightReelUI()
     window.show()
@@ -1,7 +1,7 @@
 import os
 import logging
 import traceback  # Added for detailed error reporting
-from typing import Optional, List
+from typing import Optional, List, BinaryIO
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
@@ -99,8 +99,13 @@ class BlogProcessor:
             print(f"Error details: {error_details}")
             return False
 
-    def process_blog(self, doc_path: str, video_path: str) -> ProcessingResult:
-        """Process a blog post document with its associated video."""
+    def process_blog(self, doc_path: str, video_path: str,
+                     doc_stream: Optional[BinaryIO] = None) -> ProcessingResult:
+        """Process a blog post document with its associated video.
+
+        If doc_stream is given, the document is read from that file-like object
+        and doc_path is only used as its display name.
+        """
         result = ProcessingResult(
             success=False,
             errors=[],
@@ -109,7 +114,7 @@ class BlogProcessor:
 
         try:
             # Validate input files
-            if not os.path.exists(doc_path):
+            if doc_stream is None and not os.path.exists(doc_path):
                 raise FileNotFoundError(f"Blog document not found: {doc_path}")
             if not os.path.exists(video_path):
                 raise FileNotFoundError(f"Video file not found: {video_path}")
@@ -117,7 +122,7 @@ class BlogProcessor:
             # Create reader and parse document
             reader = BlogDocumentReader()
             print(f"Parsing document: {doc_path}")
-            markers, blog_text = reader.extract_markers(doc_path)
+            markers, blog_text = reader.extract_markers(doc_stream if doc_stream is not None else doc_path)
             print(f"Found {len(markers)} media markers")
 
             # Validate markers
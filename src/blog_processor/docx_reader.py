@@ -1,7 +1,7 @@
 import re
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, BinaryIO, Union
 from docx import Document
 
 
@@ -52,8 +52,8 @@ class BlogDocumentReader:
             self.logger.error(f"Error parsing time '{time_str}': {str(e)}")
             raise
 
-    def extract_markers(self, doc_path: str) -> tuple[List[MediaMarker], str]:
-        """Extract media markers from Word document."""
+    def extract_markers(self, doc_path: Union[str, BinaryIO]) -> tuple[List[MediaMarker], str]:
+        """Extract media markers from Word document (a path or a readable file-like object)."""
         self.logger.info(f"Reading document: {doc_path}")
         doc = Document(doc_path)
         full_text = []
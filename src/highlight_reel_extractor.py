@@ -1,12 +1,55 @@
 import re
 import os
+import sys
+import bisect
+import shutil
+import functools
+import subprocess
+import tempfile
 import ffmpeg  # Add this
-import tempfile  # Add this
-from typing import List
+from typing import Callable, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import timedelta
 from src.utils import validate_timestamps
 
+# ffmpeg/ffprobe executables, resolved on PATH once at import
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Keep direct ffmpeg/ffprobe calls from opening a console window on Windows
+_SUBPROCESS_FLAGS = {'creationflags': subprocess.CREATE_NO_WINDOW} if sys.platform == 'win32' else {}
+
+# Furthest (in seconds) a segment start may be moved back to reach a keyframe
+# before the stream-copy path gives up and the reel is re-encoded instead
+MAX_KEYFRAME_SNAP = 2.0
+
+# Upper bound on concurrent ffmpeg cut jobs; throughput drops off past ~10 decoders
+MAX_CUT_WORKERS = 8
+
+# H.264 encoders in order of preference; the hardware ones are used when ffmpeg has them
+HARDWARE_ENCODERS = ['h264_nvenc', 'h264_videotoolbox', 'h264_qsv']
+SOFTWARE_ENCODER = 'libx264'
+
+# Hardware encoders that failed to encode in this process (ffmpeg can list one
+# without a usable device); _video_encoder skips them from then on
+_FAILED_ENCODERS = set()
+
+# Segment parsing patterns, compiled once at import instead of on every parse
+_MINUTES_RE = re.compile(r'(\d+)\s*minute')
+_SECONDS_RE = re.compile(r'(\d+)\s*second')
+_MINUTES_VALUE_RE = re.compile(r'(\d+)\s*minutes?')
+_TITLE_MINUTES_RE = re.compile(r'\((\d+)\s*minutes?\)')
+_SEGMENT_HEADER_RE = re.compile(r'Segment \d+:')
+_PASTED_SPLIT_RE = re.compile(r'Segment\s+\d+:\s+')
+_PASTED_TITLE_RE = re.compile(r'(.+?)\s*\(([^)]+)\)')
+_PASTED_TIMESTAMP_RE = re.compile(r'\*\*STARTING TIMESTAMP:\*\*\s*(\d+:\d+:\d+)')
+_PASTED_DESCRIPTION_RE = re.compile(r'\*\*CONTENT DESCRIPTION:\*\*\s*(.+?)(?=Segment\s+\d+:|$)', re.DOTALL)
+_CUSTOM_TITLE_RE = re.compile(r"Segment \d+: (.*?) \(([^)]+)\)")
+_CUSTOM_TIMESTAMP_RE = re.compile(r"\*\*STARTING TIMESTAMP:\*\* (\d+:\d+:\d+)")
+_CUSTOM_DESCRIPTION_RE = re.compile(r"\*\*CONTENT DESCRIPTION:\*\* (.*)")
+_PROGRESS_RE = re.compile(rb"out_time_ms=(\d+)")
+
 @dataclass
 class VideoSegment:
     """Represents a segment of video to include in the highlight reel."""
@@ -15,6 +58,19 @@ class VideoSegment:
     title: str  # Title or name of the segment
     description: str  # Optional description
 
+    @functools.cached_property
+    def start_hms(self) -> str:
+        """Start time formatted as HH:MM:SS (computed once per segment)."""
+        hours, rem = divmod(self.start_time, 3600)
+        mins, secs = divmod(rem, 60)
+        return f"{hours:02d}:{mins:02d}:{secs:02d}"
+
+    @functools.cached_property
+    def duration_ms(self) -> str:
+        """Duration formatted as MM:SS (computed once per segment)."""
+        mins, secs = divmod(self.duration, 60)
+        return f"{mins:02d}:{secs:02d}"
+
 
 def parse_timestamp(timestamp_str: str) -> int:
     """
@@ -69,8 +125,8 @@ def parse_duration(duration_str: str) -> int:
         return minutes * 60 + seconds
 
     # Check if it's in "X minutes" or "X minutes Y seconds" format
-    minutes_match = re.search(r'(\d+)\s*minute', duration_str)
-    seconds_match = re.search(r'(\d+)\s*second', duration_str)
+    minutes_match = _MINUTES_RE.search(duration_str)
+    seconds_match = _SECONDS_RE.search(duration_str)
 
     minutes = int(minutes_match.group(1)) if minutes_match else 0
     seconds = int(seconds_match.group(1)) if seconds_match else 0
@@ -95,8 +151,7 @@ def parse_pasted_segments(text_content: str) -> List[VideoSegment]:
     text_content = text_content.replace('\r\n', '\n').replace('\r', '\n')
 
     # Split by "Segment X:" pattern to get individual segment texts
-    segment_pattern = r'Segment\s+\d+:\s+'
-    segment_texts = re.split(segment_pattern, text_content)
+    segment_texts = _PASTED_SPLIT_RE.split(text_content)
 
     # Skip the first split result if it's empty (usually the case)
     if segment_texts and not segment_texts[0].strip():
@@ -107,8 +162,7 @@ def parse_pasted_segments(text_content: str) -> List[VideoSegment]:
     for i, segment_text in enumerate(segment_texts):
         try:
             # Extract title and duration
-            title_duration_pattern = r'(.+?)\s*\(([^)]+)\)'
-            title_match = re.search(title_duration_pattern, segment_text)
+            title_match = _PASTED_TITLE_RE.search(segment_text)
 
             if not title_match:
                 print(f"No title/duration match in segment {i + 1}")
@@ -118,8 +172,7 @@ def parse_pasted_segments(text_content: str) -> List[VideoSegment]:
             duration_str = title_match.group(2).strip()
 
             # Extract timestamp
-            timestamp_pattern = r'\*\*STARTING TIMESTAMP:\*\*\s*(\d+:\d+:\d+)'
-            timestamp_match = re.search(timestamp_pattern, segment_text)
+            timestamp_match = _PASTED_TIMESTAMP_RE.search(segment_text)
 
             if not timestamp_match:
                 print(f"No timestamp match in segment {i + 1}")
@@ -129,8 +182,7 @@ def parse_pasted_segments(text_content: str) -> List[VideoSegment]:
 
             # Extract description (optional)
             description = ""
-            desc_pattern = r'\*\*CONTENT DESCRIPTION:\*\*\s*(.+?)(?=Segment\s+\d+:|$)'
-            desc_match = re.search(desc_pattern, segment_text, re.DOTALL)
+            desc_match = _PASTED_DESCRIPTION_RE.search(segment_text)
 
             if desc_match:
                 description = desc_match.group(1).strip()
@@ -181,7 +233,7 @@ def extract_segments_from_text(text_content: str) -> List[VideoSegment]:
             return segments
 
     # Check if we have the custom format with "Segment X:" pattern
-    if re.search(r'Segment \d+:', text_content):
+    if _SEGMENT_HEADER_RE.search(text_content):
         return _extract_custom_segments(text_content)
 
     # Try the original formats (simple format with distinct sections or markdown format)
@@ -254,7 +306,7 @@ def extract_segments_from_text(text_content: str) -> List[VideoSegment]:
                 timestamp = parse_timestamp(time_value)
 
                 # Parse duration
-                duration_match = re.search(r'(\d+)\s*minutes?', duration_value)
+                duration_match = _MINUTES_VALUE_RE.search(duration_value)
                 if duration_match:
                     duration = int(duration_match.group(1)) * 60
                 else:
@@ -298,7 +350,7 @@ def extract_segments_from_text(text_content: str) -> List[VideoSegment]:
                 current_description = []
 
                 # Extract duration if present in the title
-                duration_match = re.search(r'\((\d+)\s*minutes?\)', current_title)
+                duration_match = _TITLE_MINUTES_RE.search(current_title)
                 if duration_match:
                     # Convert minutes to seconds
                     current_duration = int(duration_match.group(1)) * 60
@@ -387,8 +439,7 @@ def _extract_custom_segments(text_content: str) -> List[VideoSegment]:
                 current_description = []
 
             # Extract title and duration
-            title_duration_pattern = r"Segment \d+: (.*?) \(([^)]+)\)"
-            match = re.search(title_duration_pattern, line)
+            match = _CUSTOM_TITLE_RE.search(line)
             if match:
                 current_title = match.group(1).strip()
                 duration_str = match.group(2).strip()
@@ -400,8 +451,7 @@ def _extract_custom_segments(text_content: str) -> List[VideoSegment]:
 
         # Check if this line contains a timestamp
         elif "**STARTING TIMESTAMP:**" in line:
-            timestamp_pattern = r"\*\*STARTING TIMESTAMP:\*\* (\d+:\d+:\d+)"
-            match = re.search(timestamp_pattern, line)
+            match = _CUSTOM_TIMESTAMP_RE.search(line)
             if match:
                 timestamp_str = match.group(1).strip()
                 current_timestamp = parse_timestamp(timestamp_str)
@@ -409,8 +459,7 @@ def _extract_custom_segments(text_content: str) -> List[VideoSegment]:
 
                 # Extract description if it's on the same line
                 if "**CONTENT DESCRIPTION:**" in line:
-                    desc_pattern = r"\*\*CONTENT DESCRIPTION:\*\* (.*)"
-                    desc_match = re.search(desc_pattern, line)
+                    desc_match = _CUSTOM_DESCRIPTION_RE.search(line)
                     if desc_match:
                         current_description.append(desc_match.group(1).strip())
 
@@ -431,14 +480,25 @@ def _extract_custom_segments(text_content: str) -> List[VideoSegment]:
     return segments
 
 
-def create_highlight_reel(video_path: str, segments: List[VideoSegment], output_path: str) -> str:
+def create_highlight_reel(video_path: str, segments: List[VideoSegment], output_path: str,
+                          fast_copy: bool = True,
+                          on_progress: Optional[Callable[[str], None]] = None) -> str:
     """
     Create a highlight reel by concatenating multiple video segments.
 
+    With fast_copy, each segment start is moved back to the nearest keyframe and
+    the segments are stream-copied without re-encoding. If any segment is too far
+    from a keyframe (or keyframes can't be read), or fast_copy is False, all
+    segments are re-encoded and joined by a single ffmpeg process, with each
+    segment read from its own input seeked to its start.
+
     Args:
         video_path: Path to the source video file
         segments: List of VideoSegment objects defining which parts to include
         output_path: Path where the highlight reel should be saved
+        fast_copy: Try the keyframe-aligned stream-copy path first
+        on_progress: Optional callback receiving progress messages; it may be
+            called from worker threads
 
     Returns:
         Path to the created highlight reel video
@@ -446,36 +506,148 @@ def create_highlight_reel(video_path: str, segments: List[VideoSegment], output_
     if not os.path.exists(video_path):
         raise FileNotFoundError(f"Video file not found: {video_path}")
 
+    for i, segment in enumerate(segments):
+        validate_timestamps([segment.start_time])
+        if segment.duration <= 0:
+            raise ValueError(f"Duration must be positive for segment {i + 1}")
+
+    # Create output directory if it doesn't exist
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+    if fast_copy:
+        starts = _keyframe_aligned_starts(video_path, segments)
+        if starts is not None:
+            return _render_with_stream_copy(video_path, segments, starts, output_path, on_progress)
+        print("Segments are not keyframe-aligned, re-encoding highlight reel...")
+
+    return _render_with_filter_graph(video_path, segments, output_path, on_progress=on_progress)
+
+
+def _keyframe_times(video_path: str, around: List[float]) -> List[float]:
+    """
+    List the presentation times of the video keyframes near the given times.
+
+    Only a window of MAX_KEYFRAME_SNAP seconds on either side of each time is
+    read (ffprobe seeks to the keyframe before each window), so the cost grows
+    with the number of segments rather than the length of the file.
+
+    Args:
+        video_path: Path to the video file
+        around: Times in seconds (segment starts) to look for keyframes around
+
+    Returns:
+        Sorted list of keyframe times in seconds (empty if they can't be read)
+    """
+    intervals = ",".join(f"{max(time - MAX_KEYFRAME_SNAP, 0):g}%+{2 * MAX_KEYFRAME_SNAP:g}"
+                         for time in sorted(set(around)))
+    try:
+        probe = subprocess.run(
+            [FFPROBE, "-v", "error", "-select_streams", "v:0", "-read_intervals", intervals,
+             "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", video_path],
+            capture_output=True, text=True, check=True, shell=False, **_SUBPROCESS_FLAGS)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Could not read keyframes: {e}")
+        return []
+
+    # Windows of nearby segments can overlap, so the same keyframe may be listed twice
+    times = set()
+    for line in probe.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags and pts_time not in ('', 'N/A'):
+            times.add(float(pts_time))
+    return sorted(times)
+
+
+def _keyframe_aligned_starts(video_path: str, segments: List[VideoSegment]) -> Optional[List[float]]:
+    """
+    Snap each segment start down to the nearest preceding keyframe.
+
+    A start before the first keyframe (e.g. 0 s when B-frames or an edit list
+    put the first keyframe slightly later) is moved forward to that keyframe.
+
+    Args:
+        video_path: Path to the source video file
+        segments: Validated list of VideoSegment objects
+
+    Returns:
+        Keyframe start time for each segment, or None if any segment would have
+        to move by more than MAX_KEYFRAME_SNAP seconds
+    """
+    keyframes = _keyframe_times(video_path, [segment.start_time for segment in segments])
+    if not keyframes:
+        return None
+
+    starts = []
+    for segment in segments:
+        index = max(bisect.bisect_right(keyframes, segment.start_time) - 1, 0)
+        if abs(segment.start_time - keyframes[index]) > MAX_KEYFRAME_SNAP:
+            return None
+        starts.append(keyframes[index])
+    return starts
+
+
+def _cut_segment(video_path: str, start: float, duration: float, segment_path: str, number: int) -> None:
+    """
+    Stream-copy one segment of the source video into its own file.
+
+    Args:
+        video_path: Path to the source video file
+        start: Keyframe-aligned start time in seconds
+        duration: Length of the cut in seconds
+        segment_path: Path of the segment file to write
+        number: 1-based segment number used in messages
+    """
+    try:
+        stream = ffmpeg.input(video_path, ss=start, t=duration)
+        stream = ffmpeg.output(stream, segment_path, c='copy', avoid_negative_ts='make_zero')
+        ffmpeg.run(stream, cmd=FFMPEG, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+    except ffmpeg.Error as e:
+        print('stdout:', e.stdout.decode('utf8'))
+        print('stderr:', e.stderr.decode('utf8'))
+        raise RuntimeError(f"Error extracting segment {number}: {str(e)}")
+
+
+def _render_with_stream_copy(video_path: str, segments: List[VideoSegment], starts: List[float],
+                             output_path: str, on_progress: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Cut each segment with stream copy from its keyframe start and concatenate them.
+
+    The cuts are independent, so they run as concurrent ffmpeg processes.
+
+    Args:
+        video_path: Path to the source video file
+        segments: Validated list of VideoSegment objects
+        starts: Keyframe-aligned start time for each segment
+        output_path: Path where the highlight reel should be saved
+        on_progress: Optional callback receiving a message as each cut finishes
+
+    Returns:
+        Path to the created highlight reel video
+    """
     # Create temp directory for segment files
     with tempfile.TemporaryDirectory() as temp_dir:
         segment_files = []
+        jobs = []
 
-        # Extract each segment individually
-        for i, segment in enumerate(segments):
-            validate_timestamps([segment.start_time])
-            if segment.duration <= 0:
-                raise ValueError(f"Duration must be positive for segment {i + 1}")
-
-            # Create a temporary file for this segment
-            segment_filename = f"segment_{i + 1:03d}.mp4"
-            segment_path = os.path.join(temp_dir, segment_filename)
+        for i, (segment, start) in enumerate(zip(segments, starts)):
+            segment_path = os.path.join(temp_dir, f"segment_{i + 1:03d}.mp4")
             segment_files.append(segment_path)
 
-            # Extract the segment using ffmpeg
+            # Keep the original end point while starting on the keyframe
+            duration = segment.start_time + segment.duration - start
             print(
-                f"Extracting segment {i + 1}: {segment.title} (Start: {timedelta(seconds=segment.start_time)}, Duration: {timedelta(seconds=segment.duration)})")
-
-            try:
-                # Use copy codecs for both audio and video
-                stream = ffmpeg.input(video_path, ss=segment.start_time, t=segment.duration)
-                stream = ffmpeg.output(stream, segment_path, c='copy')  # Use copy for both audio and video
-                ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
-            except ffmpeg.Error as e:
-                print('stdout:', e.stdout.decode('utf8'))
-                print('stderr:', e.stderr.decode('utf8'))
-                raise RuntimeError(f"Error extracting segment {i + 1}: {str(e)}")
-
-            print(f"Successfully extracted segment {i + 1}")
+                f"Extracting segment {i + 1}: {segment.title} (Start: {timedelta(seconds=start)}, Duration: {timedelta(seconds=duration)})")
+            jobs.append((video_path, start, duration, segment_path, i + 1))
+
+        # Each cut is its own ffmpeg process, so threads are enough to run them in parallel
+        workers = min(len(jobs), os.cpu_count() or 1, MAX_CUT_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_cut_segment, *job): job[-1] for job in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                print(f"Successfully extracted segment {futures[future]}")
+                if on_progress:
+                    on_progress(f"Extracted segment {futures[future]} ({done}/{len(jobs)})")
 
         # Create list file for concatenation
         list_file_path = os.path.join(temp_dir, "segments.txt")
@@ -485,17 +657,13 @@ def create_highlight_reel(video_path: str, segments: List[VideoSegment], output_
                 escaped_path = segment_path.replace('\\', '\\\\').replace("'", "\\'")
                 list_file.write(f"file '{escaped_path}'\n")
 
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-
         # Concatenate all segments using the concat demuxer
         try:
             print(f"Concatenating {len(segment_files)} segments into highlight reel...")
 
-            # Use the right concat options for both audio and video
             concat = ffmpeg.input(list_file_path, format='concat', safe=0)
-            concat = ffmpeg.output(concat, output_path, c='copy')  # Use copy for both audio and video
-            ffmpeg.run(concat, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+            concat = ffmpeg.output(concat, output_path, c='copy')
+            ffmpeg.run(concat, cmd=FFMPEG, overwrite_output=True, capture_stdout=True, capture_stderr=True)
 
             total_duration = sum(segment.duration for segment in segments)
             print(f"Highlight reel created successfully!")
@@ -507,4 +675,179 @@ def create_highlight_reel(video_path: str, segments: List[VideoSegment], output_
         except ffmpeg.Error as e:
             print('stdout:', e.stdout.decode('utf8'))
             print('stderr:', e.stderr.decode('utf8'))
-            raise RuntimeError(f"Error creating highlight reel: {str(e)}")
\ No newline at end of file
+            raise RuntimeError(f"Error creating highlight reel: {str(e)}")
+
+
+@functools.lru_cache(maxsize=1)
+def _available_encoders() -> frozenset:
+    """
+    List the encoders compiled into ffmpeg (queried once per process).
+
+    Returns:
+        Set of encoder names (empty if ffmpeg can't be run)
+    """
+    try:
+        listing = subprocess.run([FFMPEG, "-hide_banner", "-encoders"],
+                                 capture_output=True, text=True, check=True, shell=False,
+                                 **_SUBPROCESS_FLAGS).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    return frozenset(line.split()[1] for line in listing.splitlines() if len(line.split()) > 1)
+
+
+def _video_encoder() -> str:
+    """
+    Pick the H.264 encoder to use for re-encoding, preferring hardware encoders.
+
+    Hardware encoders that already failed in this process are skipped.
+
+    Returns:
+        Name of the ffmpeg video encoder
+    """
+    available = _available_encoders() - _FAILED_ENCODERS
+    preferred = HARDWARE_ENCODERS
+    if sys.platform == 'darwin':
+        preferred = ['h264_videotoolbox'] + [e for e in HARDWARE_ENCODERS if e != 'h264_videotoolbox']
+
+    return next((encoder for encoder in preferred if encoder in available), SOFTWARE_ENCODER)
+
+
+def _run_with_progress(stream, total_duration: float,
+                       on_progress: Optional[Callable[[str], None]] = None) -> None:
+    """
+    Run an ffmpeg-python output stream, reporting encode progress as it goes.
+
+    ffmpeg writes -progress key=value blocks to stderr, which is read as raw bytes
+    from an unbuffered pipe and scanned with a bytes regex, without decoding it
+    into lines.
+
+    Args:
+        stream: ffmpeg-python output stream to run
+        total_duration: Expected output duration in seconds, used for the percentage
+        on_progress: Optional callback receiving progress messages
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with a non-zero status
+    """
+    args = ffmpeg.compile(stream, cmd=FFMPEG, overwrite_output=True)
+    args[1:1] = ['-progress', 'pipe:2', '-nostats']
+
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               bufsize=0, **_SUBPROCESS_FLAGS)
+    fd = process.stderr.fileno()
+    total_us = max(int(total_duration * 1_000_000), 1)
+    output = bytearray()
+    scanned = 0
+    last_percent = -1
+
+    while chunk := os.read(fd, 4096):
+        output += chunk
+        # Only scan complete lines so a value split across reads isn't cut short
+        end = output.rfind(b'\n') + 1
+        if end <= scanned:
+            continue
+        matches = _PROGRESS_RE.findall(output, scanned, end)
+        scanned = end
+        if matches and on_progress:
+            # out_time_ms is in microseconds despite its name
+            percent = min(int(matches[-1]) * 100 // total_us, 100)
+            if percent != last_percent:
+                last_percent = percent
+                on_progress(f"Rendering highlight reel: {percent}%")
+
+    process.stderr.close()
+    if process.wait() != 0:
+        raise ffmpeg.Error(args[0], b'', bytes(output))
+
+
+def _has_audio(video_path: str) -> bool:
+    """
+    Check whether a video file contains an audio stream.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        True if ffprobe lists an audio stream (or the file can't be probed)
+    """
+    try:
+        streams = ffmpeg.probe(video_path, cmd=FFPROBE, select_streams='a')['streams']
+    except ffmpeg.Error as e:
+        print(f"Could not probe audio streams: {e.stderr.decode('utf8', errors='replace')}")
+        return True
+    return bool(streams)
+
+
+def _render_with_filter_graph(video_path: str, segments: List[VideoSegment], output_path: str,
+                              encoder: Optional[str] = None,
+                              on_progress: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Cut and concatenate all segments with one ffmpeg invocation (re-encodes the output).
+
+    Args:
+        video_path: Path to the source video file
+        segments: Validated list of VideoSegment objects
+        output_path: Path where the highlight reel should be saved
+        encoder: Video encoder to use (defaults to the best available one)
+        on_progress: Optional callback receiving the encode percentage
+
+    Returns:
+        Path to the created highlight reel video
+    """
+    encoder = encoder or _video_encoder()
+
+    # Decode on the GPU as well when encoding with NVENC
+    input_options = {'hwaccel': 'cuda'} if encoder == 'h264_nvenc' else {}
+
+    # [N:a] matches nothing in a silent source, so concat video only in that case
+    has_audio = _has_audio(video_path)
+
+    # Give each segment its own input seeked with -ss/-t, so ffmpeg decodes only the
+    # segments rather than the source up to the latest one, and out-of-order
+    # segments don't have to be buffered until concat reaches them
+    streams = []
+    for i, segment in enumerate(segments):
+        print(
+            f"Adding segment {i + 1}: {segment.title} (Start: {timedelta(seconds=segment.start_time)}, Duration: {timedelta(seconds=segment.duration)})")
+        clip = ffmpeg.input(video_path, ss=segment.start_time, t=segment.duration, **input_options)
+        streams.append(clip.video)
+        if has_audio:
+            streams.append(clip.audio)
+
+    joined = ffmpeg.concat(*streams, v=1, a=int(has_audio)).node
+    outputs = [joined[0], joined[1]] if has_audio else [joined[0]]
+
+    # Hardware encoders are rate controlled by bitrate, x264 by quality
+    output_options = {'vcodec': encoder}
+    if encoder == SOFTWARE_ENCODER:
+        output_options['crf'] = 23
+    else:
+        output_options['video_bitrate'] = '8M'
+
+    total_duration = sum(segment.duration for segment in segments)
+
+    try:
+        print(f"Rendering {len(segments)} segments into highlight reel with {encoder}...")
+
+        stream = ffmpeg.output(*outputs, output_path, threads=0, **output_options)
+        _run_with_progress(stream, total_duration, on_progress)
+
+        print(f"Highlight reel created successfully!")
+        print(f"Output: {output_path}")
+        print(f"Total duration: {timedelta(seconds=total_duration)}")
+
+        return output_path
+
+    except ffmpeg.Error as e:
+        print('stdout:', e.stdout.decode('utf8'))
+        print('stderr:', e.stderr.decode('utf8'))
+
+        # ffmpeg can list a hardware encoder even when no matching device is present
+        if encoder != SOFTWARE_ENCODER:
+            _FAILED_ENCODERS.add(encoder)
+            print(f"Encoding with {encoder} failed, retrying with {SOFTWARE_ENCODER}...")
+            return _render_with_filter_graph(video_path, segments, output_path,
+                                             encoder=SOFTWARE_ENCODER, on_progress=on_progress)
+
+        raise RuntimeError(f"Error creating highlight reel: {str(e)}")
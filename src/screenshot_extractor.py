@@ -4,7 +4,7 @@ from datetime import timedelta
 from .utils import validate_timestamps
 
 
-def extract_screenshots_at_times(video_path, output_dir, timestamps):
+def extract_screenshots_at_times(video_path, output_dir, timestamps, first_index=0):
     """
     Extract screenshots from a video file at specific timestamps.
 
@@ -12,6 +12,7 @@ def extract_screenshots_at_times(video_path, output_dir, timestamps):
     video_path (str): Path to the video file
     output_dir (str): Directory to save the screenshots
     timestamps (list): List of timestamps in seconds where screenshots should be taken
+    first_index (int): Position of the first timestamp in the overall list, used for numbering filenames
     """
     # Validate inputs
     if not os.path.exists(video_path):
@@ -38,7 +39,7 @@ def extract_screenshots_at_times(video_path, output_dir, timestamps):
     print(f"Saving screenshots to: {video_output_dir}")
 
     # Extract and save screenshots
-    for i, timestamp in enumerate(timestamps):
+    for i, timestamp in enumerate(timestamps, first_index):
         # Validate timestamp against video duration
         if timestamp > duration:
             print(f"Warning: Timestamp {timestamp}s exceeds video duration {duration}s")
@@ -0,0 +1,163 @@
+import subprocess
+
+import pytest
+
+import src.highlight_reel_extractor as hre
+from src.highlight_reel_extractor import (VideoSegment, extract_segments_from_text,
+                                          parse_duration, parse_timestamp)
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("90") == 90
+    assert parse_timestamp("01:30") == 90
+    assert parse_timestamp("01:01:30") == 3690
+
+    with pytest.raises(ValueError):
+        parse_timestamp("1:2:3:4")
+
+
+def test_parse_duration():
+    assert parse_duration("(01:30)") == 90
+    assert parse_duration("2 minutes") == 120
+    assert parse_duration("1 minute 30 seconds") == 90
+
+
+def test_extract_custom_format():
+    content = """Segment 1: Opening Hook (01:30)
+**STARTING TIMESTAMP:** 00:16:30 **CONTENT DESCRIPTION:** Start with the discovery.
+
+Segment 2: Daily News (01:45)
+**STARTING TIMESTAMP:** 00:02:30 **CONTENT DESCRIPTION:** Follow the journey.
+"""
+    segments = extract_segments_from_text(content)
+
+    assert [(s.title, s.start_time, s.duration) for s in segments] == [
+        ("Opening Hook", 990, 90),
+        ("Daily News", 150, 105),
+    ]
+    assert segments[0].description == "Start with the discovery."
+
+
+def test_extract_standard_format():
+    content = """#### Introduction (2 minutes)
+STARTING TIMESTAMP: 00:01:30
+- This is the introduction
+
+#### No timestamp
+- skipped
+"""
+    segments = extract_segments_from_text(content)
+
+    assert len(segments) == 1
+    assert segments[0].start_time == 90
+    assert segments[0].duration == 120
+    assert segments[0].description == "- This is the introduction"
+
+
+def test_extract_simple_format():
+    content = """SEGMENT: Opening Segment
+TIME: 00:01:30
+DURATION: 2 minutes
+This is the opening segment.
+
+TITLE: Piped | TIMESTAMP: 05:00 | DURATION: 45
+"""
+    segments = extract_segments_from_text(content)
+
+    assert [(s.title, s.start_time, s.duration) for s in segments] == [
+        ("Opening Segment", 90, 120),
+        ("Piped", 300, 45),
+    ]
+
+
+def test_segment_formatted_times():
+    segment = VideoSegment(start_time=3690, duration=105, title="Intro", description="")
+
+    assert segment.start_hms == "01:01:30"
+    assert segment.duration_ms == "01:45"
+
+
+def test_filter_graph_without_audio(monkeypatch):
+    captured = {}
+    monkeypatch.setattr(hre, "_has_audio", lambda path: False)
+    monkeypatch.setattr(hre, "_run_with_progress",
+                        lambda stream, total, on_progress: captured.setdefault("args", stream.get_args()))
+    segments = [VideoSegment(start_time=10, duration=5, title="A", description="")]
+
+    hre._render_with_filter_graph("in.mp4", segments, "out.mp4", encoder=hre.SOFTWARE_ENCODER)
+
+    graph = captured["args"][captured["args"].index("-filter_complex") + 1]
+    assert "[0:a]" not in graph
+    assert "a=0" in graph
+
+
+def _segments(*starts):
+    return [VideoSegment(start_time=start, duration=5, title=f"S{start}", description="")
+            for start in starts]
+
+
+@pytest.mark.parametrize("keyframes, starts, expected", [
+    ([0.0, 4.0, 8.0], (5, 9), [4.0, 8.0]),  # within the snap limit
+    ([0.0, 10.0], (5,), None),  # too far from the preceding keyframe
+    ([0.08, 4.0], (0, 4), [0.08, 4.0]),  # before the first keyframe
+    ([3.0, 6.0], (0,), None),  # first keyframe too far ahead
+    ([], (0,), None),  # keyframes unreadable
+])
+def test_keyframe_aligned_starts(monkeypatch, keyframes, starts, expected):
+    monkeypatch.setattr(hre, "_keyframe_times", lambda path, around: keyframes)
+
+    assert hre._keyframe_aligned_starts("in.mp4", _segments(*starts)) == expected
+
+
+def test_filter_graph_seeks_each_segment(monkeypatch):
+    captured = {}
+    monkeypatch.setattr(hre, "_has_audio", lambda path: True)
+    monkeypatch.setattr(hre, "_run_with_progress",
+                        lambda stream, total, on_progress: captured.setdefault("args", stream.get_args()))
+    segments = [VideoSegment(start_time=990, duration=90, title="A", description=""),
+                VideoSegment(start_time=150, duration=105, title="B", description="")]
+
+    hre._render_with_filter_graph("in.mp4", segments, "out.mp4", encoder=hre.SOFTWARE_ENCODER)
+
+    args = captured["args"]
+    inputs = [args[i - 4:i] for i, arg in enumerate(args) if arg == "-i"]
+    assert [sorted(zip(part[::2], part[1::2])) for part in inputs] == [
+        [("-ss", "990"), ("-t", "90")],
+        [("-ss", "150"), ("-t", "105")],
+    ]
+    assert "trim" not in args[args.index("-filter_complex") + 1]
+
+
+def test_keyframe_times_reads_only_segment_windows(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="0.5,K__\n1.0,___\n61.0,K__\n61.0,K__\n")
+
+    monkeypatch.setattr(hre.subprocess, "run", fake_run)
+
+    assert hre._keyframe_times("in.mp4", [60, 1, 60]) == [0.5, 61.0]
+    args = calls[0]
+    assert args[args.index("-read_intervals") + 1] == "0%+4,58%+4"
+
+
+def test_failed_hardware_encoder_is_skipped(monkeypatch):
+    monkeypatch.setattr(hre, "_available_encoders", lambda: frozenset({"h264_qsv", "libx264"}))
+    monkeypatch.setattr(hre, "_FAILED_ENCODERS", set())
+    monkeypatch.setattr(hre, "_has_audio", lambda path: True)
+    encoders = []
+
+    def fake_run(stream, total, on_progress):
+        args = stream.get_args()
+        encoders.append(args[args.index("-vcodec") + 1])
+        if encoders[-1] != hre.SOFTWARE_ENCODER:
+            raise hre.ffmpeg.Error("ffmpeg", b"", b"no device")
+
+    monkeypatch.setattr(hre, "_run_with_progress", fake_run)
+    segments = [VideoSegment(start_time=0, duration=5, title="A", description="")]
+
+    hre._render_with_filter_graph("in.mp4", segments, "out.mp4")
+    hre._render_with_filter_graph("in.mp4", segments, "out.mp4")
+
+    assert encoders == ["h264_qsv", "libx264", "libx264"]